@@ -88,10 +88,16 @@ WSGI_APPLICATION = "config.wsgi.application"
 DATABASES = {
     "default": dj_database_url.config(
         default=f'sqlite:///{BASE_DIR / "db.sqlite3"}',
-        conn_max_age=600
+        conn_max_age=int(os.getenv('CONN_MAX_AGE', '600')),
+        conn_health_checks=True
     )
 }
 
+# Set DB_PGBOUNCER=True when DATABASE_URL points at pgbouncer in transaction
+# pooling mode; server-side cursors do not survive across pooled transactions
+if os.getenv('DB_PGBOUNCER', 'False') == 'True':
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -139,9 +145,8 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
-    ],
+        'rules.renderers.ORJSONRenderer',
+    ] + (['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
     ],
@@ -151,6 +156,9 @@ REST_FRAMEWORK = {
 }
 
 # Swagger settings
+# Set ENABLE_SWAGGER=False to drop the API docs routes and schema decorators
+ENABLE_SWAGGER = os.getenv('ENABLE_SWAGGER', 'True') == 'True'
+
 SWAGGER_SETTINGS = {
     'SECURITY_DEFINITIONS': {
         'basic': {
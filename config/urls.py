@@ -15,44 +15,49 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-
-# Swagger/OpenAPI schema configuration
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Pluggable Rule Engine API",
-        default_version='v1',
-        description="""
-        A flexible rule engine for validating orders against configurable rules.
-
-        ## Features
-        - Auto-registered rules (add new rules without modifying existing code)
-        - RESTful API for rule evaluation
-        - Comprehensive validation and error handling
-        - Swagger documentation
-
-        ## Available Rules
-        - `min_total_100`: Order total must be greater than 100
-        - `min_items_2`: Order must have at least 2 items
-        - `divisible_by_5`: Order total must be divisible by 5
-        """,
-        contact=openapi.Contact(email="contact@example.com"),
-        license=openapi.License(name="MIT License"),
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("rules/", include('rules.urls')),
+]
+
+if settings.ENABLE_SWAGGER:
+    from rest_framework import permissions
+    from drf_yasg.views import get_schema_view
+    from drf_yasg import openapi
+
+    # Swagger/OpenAPI schema configuration
+    schema_view = get_schema_view(
+        openapi.Info(
+            title="Pluggable Rule Engine API",
+            default_version='v1',
+            description="""
+            A flexible rule engine for validating orders against configurable rules.
+
+            ## Features
+            - Auto-registered rules (add new rules without modifying existing code)
+            - RESTful API for rule evaluation
+            - Comprehensive validation and error handling
+            - Swagger documentation
+
+            ## Available Rules
+            - `min_total_100`: Order total must be greater than 100
+            - `min_items_2`: Order must have at least 2 items
+            - `divisible_by_5`: Order total must be divisible by 5
+            """,
+            contact=openapi.Contact(email="contact@example.com"),
+            license=openapi.License(name="MIT License"),
+        ),
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
 
     # API Documentation
-    path('', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
-    path('swagger.json', schema_view.without_ui(cache_timeout=0), name='schema-json'),
-]
+    urlpatterns += [
+        path('', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
+        path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+        path('swagger.json', schema_view.without_ui(cache_timeout=0), name='schema-json'),
+    ]
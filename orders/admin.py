@@ -1,10 +1,40 @@
+from decimal import Decimal
+
+from django import forms
 from django.contrib import admin
 from .models import Order
 
 
+class OrderAdminForm(forms.ModelForm):
+    """Admin form that edits the order total in currency units rather than cents."""
+    total = forms.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        min_value=Decimal('0.00'),
+        help_text="Total amount of the order"
+    )
+
+    class Meta:
+        model = Order
+        fields = ('items_count',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk is not None:
+            self.fields['total'].initial = self.instance.total
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if cleaned_data.get('total') is not None:
+            # Stored as total_cents through the model's total setter
+            self.instance.total = cleaned_data['total']
+        return cleaned_data
+
+
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
     """Admin interface for Order model."""
+    form = OrderAdminForm
     list_display = ('id', 'total', 'items_count', 'created_at', 'updated_at')
     list_filter = ('created_at', 'updated_at')
     search_fields = ('id',)
@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from orders.models import Order
 from decimal import Decimal
 
@@ -7,22 +8,26 @@ class Command(BaseCommand):
     help = 'Seeds the database with example orders'
 
     def handle(self, *args, **kwargs):
-        # Only seed if no orders exist
-        if Order.objects.exists():
-            self.stdout.write(self.style.WARNING('Orders already exist. Skipping seed.'))
-            return
+        # Check and insert in one transaction so the seed commits once
+        with transaction.atomic():
+            # Only seed if no orders exist
+            if Order.objects.exists():
+                self.stdout.write(self.style.WARNING('Orders already exist. Skipping seed.'))
+                return
 
-        # Create example orders
-        orders_data = [
-            {'total': Decimal('150.00'), 'items_count': 3},
-            {'total': Decimal('75.50'), 'items_count': 1},
-            {'total': Decimal('200.00'), 'items_count': 5},
-        ]
+            # Create example orders
+            orders_data = [
+                {'total': Decimal('150.00'), 'items_count': 3},
+                {'total': Decimal('75.50'), 'items_count': 1},
+                {'total': Decimal('200.00'), 'items_count': 5},
+            ]
 
-        orders = []
-        for data in orders_data:
-            order = Order.objects.create(**data)
-            orders.append(order)
+            orders = Order.objects.bulk_create(
+                [Order(**data) for data in orders_data],
+                batch_size=1000
+            )
+
+        for order in orders:
             self.stdout.write(
                 self.style.SUCCESS(
                     f'Created order #{order.id}: Total=${order.total}, Items={order.items_count}'
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-14 04:37
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="order",
+            name="orders_orde_total_e60176_idx",
+        ),
+    ]
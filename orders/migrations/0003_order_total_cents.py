@@ -0,0 +1,58 @@
+from decimal import Decimal
+
+import django.core.validators
+from django.db import migrations, models
+
+
+def total_to_cents(apps, schema_editor):
+    Order = apps.get_model("orders", "Order")
+    orders = list(Order.objects.only("id", "total"))
+    for order in orders:
+        order.total_cents = int((order.total * 100).to_integral_value())
+    Order.objects.bulk_update(orders, ["total_cents"], batch_size=1000)
+
+
+def cents_to_total(apps, schema_editor):
+    Order = apps.get_model("orders", "Order")
+    orders = list(Order.objects.only("id", "total_cents"))
+    for order in orders:
+        order.total = Decimal(order.total_cents).scaleb(-2)
+    Order.objects.bulk_update(orders, ["total"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0002_remove_order_total_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="total_cents",
+            field=models.BigIntegerField(
+                default=0,
+                help_text="Total amount of the order, in cents",
+                validators=[django.core.validators.MinValueValidator(0)],
+            ),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name="order",
+            name="total",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=Decimal("0.00"),
+                help_text="Total amount of the order",
+                max_digits=10,
+                validators=[
+                    django.core.validators.MinValueValidator(Decimal("0.00"))
+                ],
+            ),
+        ),
+        migrations.RunPython(total_to_cents, cents_to_total),
+        migrations.RemoveField(
+            model_name="order",
+            name="total",
+        ),
+    ]
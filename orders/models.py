@@ -8,16 +8,14 @@ class Order(models.Model):
     Order model representing a customer order.
 
     Attributes:
-        total: The total amount of the order (must be non-negative)
+        total_cents: The total amount of the order in cents (must be non-negative)
         items_count: The number of items in the order (must be positive)
         created_at: Timestamp when the order was created
         updated_at: Timestamp when the order was last updated
     """
-    total = models.DecimalField(
-        max_digits=10,
-        decimal_places=2,
-        validators=[MinValueValidator(Decimal('0.00'))],
-        help_text="Total amount of the order"
+    total_cents = models.BigIntegerField(
+        validators=[MinValueValidator(0)],
+        help_text="Total amount of the order, in cents"
     )
     items_count = models.PositiveIntegerField(
         validators=[MinValueValidator(1)],
@@ -32,9 +30,17 @@ class Order(models.Model):
         verbose_name_plural = 'Orders'
         indexes = [
             models.Index(fields=['-created_at']),
-            models.Index(fields=['total']),
         ]
 
+    @property
+    def total(self) -> Decimal:
+        """The total amount of the order as a two-decimal Decimal."""
+        return Decimal(self.total_cents).scaleb(-2)
+
+    @total.setter
+    def total(self, value) -> None:
+        self.total_cents = int((Decimal(value) * 100).to_integral_value())
+
     def __str__(self):
         return f"Order #{self.id} - Total: ${self.total}, Items: {self.items_count}"
 
@@ -4,6 +4,11 @@ from .models import Order
 
 class OrderSerializer(serializers.ModelSerializer):
     """Serializer for Order model."""
+    total = serializers.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        help_text="Total amount of the order"
+    )
 
     class Meta:
         model = Order
@@ -1,3 +1,40 @@
 from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from .admin import OrderAdminForm
+from .models import Order
+
+
+class TestOrderModel(TestCase):
+    """Tests for the Order model."""
+
+    def test_total_is_stored_in_cents(self):
+        """Test that the total is stored as whole cents."""
+        order = Order.objects.create(total=Decimal('75.50'), items_count=1)
+        order.refresh_from_db()
+
+        self.assertEqual(order.total_cents, 7550)
+        self.assertEqual(order.total, Decimal('75.50'))
+        self.assertEqual(str(order.total), '75.50')
+
+
+class TestOrderAdminForm(TestCase):
+    """Tests for the Order admin form."""
+
+    def test_total_is_entered_in_currency_units(self):
+        """Test that the admin edits the total as a decimal amount."""
+        form = OrderAdminForm(data={'total': '75.50', 'items_count': 1})
+        self.assertTrue(form.is_valid(), form.errors)
+        order = form.save()
+        order.refresh_from_db()
+
+        self.assertEqual(order.total_cents, 7550)
+
+        form = OrderAdminForm(instance=order)
+        self.assertEqual(form['total'].value(), Decimal('75.50'))
+
+    def test_negative_total_is_rejected(self):
+        """Test that the admin form rejects a negative total."""
+        form = OrderAdminForm(data={'total': '-1.00', 'items_count': 1})
+        self.assertFalse(form.is_valid())
+        self.assertIn('total', form.errors)
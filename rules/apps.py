@@ -8,6 +8,13 @@ class RulesConfig(AppConfig):
     def ready(self):
         """
         Import rules when the app is ready to ensure they are registered.
+
+        The registry is frozen afterwards, so rule modules must be imported here.
         """
         # Import rules to trigger auto-registration
         from . import order_rules  # noqa: F401
+        from .engine import RuleRegistry
+
+        # Rules only change at startup, so the rule list can be serialized once
+        RuleRegistry.build_rules_list_json()
+        RuleRegistry.freeze()
@@ -6,9 +6,14 @@ discovers and registers all rule classes. New rules can be added without modifyi
 existing code - simply create a new class that inherits from BaseRule.
 """
 
+import hashlib
 import logging
-from abc import ABCMeta, abstractmethod
-from typing import Dict, Type, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, KeysView, Mapping, Type, Any
+
+import numpy as np
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +25,13 @@ class RuleRegistry:
     Rules are automatically registered when their class is defined,
     thanks to the metaclass used in BaseRule.
     """
-    _rules: Dict[str, Type['BaseRule']] = {}
+    _rules: Mapping[str, Type['BaseRule']] = {}
+    _instances: Mapping[str, 'BaseRule'] = {}
+    _vector_impls: Mapping[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {}
+    _rules_list_json: bytes = None
+    _rules_list_etag: str = None
+    _valid_names: frozenset = None
+    _frozen: bool = False
 
     @classmethod
     def register(cls, name: str, rule_class: Type['BaseRule']) -> None:
@@ -30,11 +41,43 @@ class RuleRegistry:
         Args:
             name: Unique identifier for the rule
             rule_class: The rule class to register
+
+        Raises:
+            RuntimeError: If the registry has been frozen
         """
+        if cls._frozen:
+            raise RuntimeError(f"Cannot register rule '{name}': the rule registry is frozen")
         if name in cls._rules:
-            logger.warning(f"Rule '{name}' is being overridden")
+            logger.warning("Rule '%s' is being overridden", name)
         cls._rules[name] = rule_class
-        logger.info(f"Registered rule: {name}")
+        # Rules are stateless, so a single shared instance serves every evaluation
+        cls._instances[name] = rule_class()
+        # Rules may optionally provide a vectorized implementation for bulk evaluation
+        if hasattr(rule_class, 'vector_evaluate'):
+            cls._vector_impls[name] = rule_class.vector_evaluate
+        else:
+            cls._vector_impls.pop(name, None)
+        # Resolved rule combinations may hold a rule that was just overridden
+        _resolve_rules.cache_clear()
+        cls._rules_list_json = None
+        cls._rules_list_etag = None
+        cls._valid_names = None
+        logger.info("Registered rule: %s", name)
+
+    @classmethod
+    def freeze(cls) -> None:
+        """
+        Make the registry read-only.
+
+        Called once all rules have been imported at startup. Afterwards the
+        registry is only read, and any attempt to register a rule fails.
+        """
+        if cls._frozen:
+            return
+        cls._rules = MappingProxyType(cls._rules)
+        cls._instances = MappingProxyType(cls._instances)
+        cls._vector_impls = MappingProxyType(cls._vector_impls)
+        cls._frozen = True
 
     @classmethod
     def get_rule(cls, name: str) -> Type['BaseRule']:
@@ -54,31 +97,163 @@ class RuleRegistry:
             raise KeyError(f"Rule '{name}' not found. Available rules: {list(cls._rules.keys())}")
         return cls._rules[name]
 
+    @classmethod
+    def get_instance(cls, name: str) -> 'BaseRule':
+        """
+        Retrieve the shared instance of a rule by name.
+
+        Args:
+            name: The rule identifier
+
+        Returns:
+            The cached rule instance
+
+        Raises:
+            KeyError: If the rule is not found
+        """
+        if name not in cls._instances:
+            raise KeyError(f"Rule '{name}' not found. Available rules: {list(cls._rules.keys())}")
+        return cls._instances[name]
+
+    @classmethod
+    def get_instance_unchecked(cls, name: str) -> 'BaseRule':
+        """
+        Retrieve the shared instance of a rule with a single lookup.
+
+        Intended for hot paths where rule names were already validated
+        (e.g. by RuleCheckRequestSerializer); an unknown name still raises
+        a bare KeyError.
+        """
+        return cls._instances[name]
+
+    @classmethod
+    def get_vector_impl(cls, name: str) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Retrieve the vectorized implementation of a rule, if it provides one.
+
+        Args:
+            name: The rule identifier
+
+        Returns:
+            The rule's vector_evaluate callable, or None
+        """
+        return cls._vector_impls.get(name)
+
     @classmethod
     def get_all_rules(cls) -> Dict[str, Type['BaseRule']]:
         """Get all registered rules."""
         return cls._rules.copy()
 
+    @classmethod
+    def build_rules_list_json(cls) -> bytes:
+        """
+        Serialize the name and description of every registered rule to JSON.
+
+        The result is stored on the registry so it can be served as-is,
+        together with an ETag derived from it.
+
+        Returns:
+            The JSON-encoded list of rules
+        """
+        cls._rules_list_json = orjson.dumps([
+            {
+                'name': rule_class.name,
+                'description': rule_class.description
+            }
+            for rule_class in cls._rules.values()
+        ])
+        # Not a security use, so FIPS-restricted builds still allow md5 here
+        digest = hashlib.md5(cls._rules_list_json, usedforsecurity=False).hexdigest()
+        cls._rules_list_etag = f'"{digest}"'
+        return cls._rules_list_json
+
+    @classmethod
+    def get_rules_list_json(cls) -> bytes:
+        """Get the JSON-encoded list of rules, building it if needed."""
+        if cls._rules_list_json is None:
+            return cls.build_rules_list_json()
+        return cls._rules_list_json
+
+    @classmethod
+    def get_required_fields(cls, rule_names: list) -> set:
+        """
+        Collect the order fields needed to evaluate the given rules.
+
+        Args:
+            rule_names: List of (already validated) rule names
+
+        Returns:
+            Set of field names to load (always including 'id'), or None if
+            any of the rules does not declare its fields
+        """
+        fields = {'id'}
+        for rule_name in rule_names:
+            rule_fields = cls._rules[rule_name].required_fields
+            if rule_fields is None:
+                return None
+            fields.update(rule_fields)
+        return fields
+
+    @classmethod
+    def get_required_relations(cls, rule_names: list) -> set:
+        """
+        Collect the order relations needed to evaluate the given rules.
+
+        Args:
+            rule_names: List of (already validated) rule names
+
+        Returns:
+            Set of relation names to prefetch
+        """
+        return {
+            relation
+            for rule_name in rule_names
+            for relation in cls._rules[rule_name].required_relations
+        }
+
+    @classmethod
+    def get_rules_list_etag(cls) -> str:
+        """Get the (quoted) ETag of the JSON-encoded list of rules."""
+        if cls._rules_list_etag is None:
+            cls.build_rules_list_json()
+        return cls._rules_list_etag
+
+    @classmethod
+    def names(cls) -> KeysView:
+        """Get a read-only view of the registered rule names."""
+        return cls._rules.keys()
+
+    @classmethod
+    def valid_names(cls) -> frozenset:
+        """Get the set of registered rule names, building it if needed."""
+        if cls._valid_names is None:
+            cls._valid_names = frozenset(cls._rules)
+        return cls._valid_names
+
     @classmethod
     def rule_exists(cls, name: str) -> bool:
         """Check if a rule is registered."""
         return name in cls._rules
 
 
-class RuleMeta(ABCMeta):
+class RuleMeta(type):
     """
     Metaclass that auto-registers rule classes.
 
     When a class using this metaclass is defined, it automatically
     registers itself with the RuleRegistry using its 'name' attribute.
 
-    Inherits from ABCMeta to be compatible with ABC.
+    A plain type metaclass is used instead of ABCMeta to keep instance
+    creation and isinstance checks cheap; the 'evaluate' method is
+    enforced here for every rule that gets registered.
     """
     def __new__(mcs, name: str, bases: tuple, attrs: dict):
         cls = super().__new__(mcs, name, bases, attrs)
 
         # Don't register the base class itself
         if name != 'BaseRule' and 'name' in attrs and attrs['name']:
+            if cls.evaluate is BaseRule.evaluate:
+                raise TypeError(f"Rule '{attrs['name']}' must implement evaluate()")
             RuleRegistry.register(attrs['name'], cls)
 
         return cls
@@ -86,13 +261,22 @@ class RuleMeta(ABCMeta):
 
 class BaseRule(metaclass=RuleMeta):
     """
-    Abstract base class for all rules.
+    Base class for all rules.
 
     To create a new rule:
     1. Inherit from this class
     2. Set the 'name' class attribute (must be unique)
-    3. Optionally set 'description'
+    3. Optionally set 'description' and 'cost' (relative evaluation cost,
+       used to run cheap rules first when short-circuiting)
     4. Implement the 'evaluate' method
+    5. Declare '__slots__' for any instance attributes (or an empty tuple),
+       so instances stay free of a per-instance __dict__
+    6. Optionally implement a 'vector_evaluate' classmethod taking NumPy
+       arrays of totals (in cents) and item counts, for bulk evaluation
+    7. Optionally set 'required_fields' to the order fields the rule reads,
+       so only those are loaded, and
+       'required_relations' to the order relations it reads, so they can be
+       prefetched together with the order
 
     The rule will be automatically registered and available for use.
 
@@ -101,12 +285,21 @@ class BaseRule(metaclass=RuleMeta):
             name = "my_custom_rule"
             description = "Checks if order meets custom criteria"
 
+            required_fields = ('total_cents',)
+
+            __slots__ = ()
+
             def evaluate(self, order) -> bool:
-                return order.total > 50
+                return order.total_cents > 5000
     """
 
+    __slots__ = ('config',)
+
     name: str = None
     description: str = ""
+    cost: int = 1
+    required_fields: tuple = None
+    required_relations: tuple = ()
 
     def __init__(self, **kwargs):
         """
@@ -117,7 +310,6 @@ class BaseRule(metaclass=RuleMeta):
         """
         self.config = kwargs
 
-    @abstractmethod
     def evaluate(self, order: Any) -> bool:
         """
         Evaluate the rule against an order.
@@ -128,7 +320,7 @@ class BaseRule(metaclass=RuleMeta):
         Returns:
             True if the order passes the rule, False otherwise
         """
-        pass
+        raise NotImplementedError(f"{self.__class__.__name__} must implement evaluate()")
 
     def __str__(self) -> str:
         return f"{self.name}: {self.description}"
@@ -137,24 +329,45 @@ class BaseRule(metaclass=RuleMeta):
         return f"<{self.__class__.__name__}(name='{self.name}')>"
 
 
+@lru_cache(maxsize=256)
+def _resolve_rules(rule_names: tuple, short_circuit: bool) -> tuple:
+    """
+    Resolve rule names to (name, instance) pairs in evaluation order.
+
+    Callers tend to request the same few combinations of rules, so the
+    resolved tuple is cached per combination. When short-circuiting, the
+    rules are ordered cheapest first so a failure can skip expensive ones.
+    """
+    resolved = tuple((name, RuleRegistry.get_instance_unchecked(name)) for name in rule_names)
+    if short_circuit:
+        resolved = tuple(sorted(resolved, key=lambda pair: pair[1].cost))
+    return resolved
+
+
 class RuleEngine:
     """
     Engine for evaluating multiple rules against an order.
 
     This class orchestrates the evaluation of rules and provides
     detailed results for each rule.
+
+    The engine holds no state, so a single instance (DEFAULT_ENGINE) is
+    shared by every request.
     """
 
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
+    __slots__ = ()
 
-    def evaluate_rules(self, order: Any, rule_names: list) -> dict:
+    @staticmethod
+    def evaluate_rules(order: Any, rule_names: list, short_circuit: bool = False) -> dict:
         """
         Evaluate multiple rules against an order.
 
         Args:
             order: The order to evaluate
             rule_names: List of rule names to evaluate
+            short_circuit: Stop at the first failing rule; rules are then run
+                cheapest first and details only contain the rules that were
+                evaluated
 
         Returns:
             Dictionary containing:
@@ -166,29 +379,24 @@ class RuleEngine:
         """
         results = {}
 
-        for rule_name in rule_names:
-            try:
-                # Get the rule class from registry
-                rule_class = RuleRegistry.get_rule(rule_name)
+        try:
+            resolved = _resolve_rules(tuple(rule_names), short_circuit)
+        except KeyError as e:
+            logger.error("Rule not found: %s", e.args[0])
+            raise
 
-                # Instantiate and evaluate
-                rule_instance = rule_class()
-                result = rule_instance.evaluate(order)
-                results[rule_name] = result
+        # Errors raised by a rule propagate to the caller (for the API, the
+        # exception handler), which logs them
+        for rule_name, rule in resolved:
+            result = rule.evaluate(order)
+            results[rule_name] = result
 
-                self.logger.debug(
-                    f"Rule '{rule_name}' evaluated for order {order.id}: {result}"
-                )
+            logger.debug(
+                "Rule '%s' evaluated for order %s: %s", rule_name, order.id, result
+            )
 
-            except KeyError as e:
-                self.logger.error(f"Rule not found: {rule_name}")
-                raise
-            except Exception as e:
-                self.logger.error(
-                    f"Error evaluating rule '{rule_name}': {str(e)}",
-                    exc_info=True
-                )
-                raise
+            if short_circuit and not result:
+                break
 
         # All rules must pass for overall success
         passed = all(results.values())
@@ -197,3 +405,91 @@ class RuleEngine:
             'passed': passed,
             'details': results
         }
+
+    @staticmethod
+    def evaluate_rules_bulk(order_qs: Any, rule_names: list) -> dict:
+        """
+        Evaluate multiple rules against every order in a queryset.
+
+        Order fields are loaded into NumPy arrays with a single query and each
+        rule is evaluated over the whole batch at once. Rules without a
+        vector_evaluate implementation fall back to per-order evaluation.
+
+        Args:
+            order_qs: Queryset of orders to evaluate
+            rule_names: List of rule names to evaluate
+
+        Returns:
+            Dictionary mapping order ids to results in the same format
+            as evaluate_rules
+
+        Raises:
+            KeyError: If a rule name is not found in the registry
+        """
+        rows = list(order_qs.values_list('id', 'total_cents', 'items_count'))
+        if not rows:
+            return {}
+
+        ids, totals, items_count = zip(*rows)
+        totals_cents = np.array(totals, dtype=np.int64)
+        items = np.array(items_count, dtype=np.int64)
+
+        results = {}
+        orders = None
+        for rule_name in rule_names:
+            RuleRegistry.get_rule(rule_name)  # Raises KeyError for unknown rules
+            vector_impl = RuleRegistry.get_vector_impl(rule_name)
+            if vector_impl is not None:
+                results[rule_name] = np.asarray(vector_impl(totals_cents, items), dtype=bool)
+            else:
+                if orders is None:
+                    # in_bulk() refuses sliced querysets, so refetch through the manager
+                    orders = order_qs.model._default_manager.in_bulk(ids)
+                rule = RuleRegistry.get_instance_unchecked(rule_name)
+                results[rule_name] = np.fromiter(
+                    (rule.evaluate(orders[order_id]) for order_id in ids),
+                    dtype=bool,
+                    count=len(rows)
+                )
+
+        if results:
+            passed = np.logical_and.reduce(list(results.values()))
+        else:
+            passed = np.ones(len(rows), dtype=bool)
+
+        details = {rule_name: values.tolist() for rule_name, values in results.items()}
+        return {
+            order_id: {
+                'passed': order_passed,
+                'details': {rule_name: values[i] for rule_name, values in details.items()}
+            }
+            for i, (order_id, order_passed) in enumerate(zip(ids, passed.tolist()))
+        }
+
+    @staticmethod
+    def evaluate_rules_many(orders: Mapping[int, Any], rule_names: list, short_circuit: bool = False) -> dict:
+        """
+        Evaluate multiple rules against several orders.
+
+        Args:
+            orders: Mapping of order ids to orders, e.g. from
+                rules.queries.fetch_orders
+            rule_names: List of rule names to evaluate
+            short_circuit: Stop at the first failing rule for each order,
+                as in evaluate_rules
+
+        Returns:
+            Dictionary mapping order ids to results in the same format as
+            evaluate_rules, in the order of the given mapping
+
+        Raises:
+            KeyError: If a rule name is not found in the registry
+        """
+        return {
+            order_id: RuleEngine.evaluate_rules(order, rule_names, short_circuit=short_circuit)
+            for order_id, order in orders.items()
+        }
+
+
+# Shared engine instance used by the API views
+DEFAULT_ENGINE = RuleEngine()
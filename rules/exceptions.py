@@ -28,7 +28,7 @@ def custom_exception_handler(exc, context):
     if response is None:
         # Log the unexpected exception
         logger.error(
-            f"Unhandled exception: {type(exc).__name__}: {str(exc)}",
+            "Unhandled exception: %s: %s", type(exc).__name__, exc,
             exc_info=True
         )
 
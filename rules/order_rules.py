@@ -6,7 +6,6 @@ Each rule is automatically registered with the RuleRegistry when imported.
 """
 
 from .engine import BaseRule
-from decimal import Decimal
 
 
 class MinimumTotalRule(BaseRule):
@@ -17,19 +16,32 @@ class MinimumTotalRule(BaseRule):
     """
     name = "min_total_100"
     description = "Validates that order total is greater than 100"
+    default_threshold = 100
+    required_fields = ('total_cents',)
+
+    __slots__ = ('threshold_cents',)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Resolve the threshold once instead of on every evaluation
+        self.threshold_cents = self.config.get('threshold', self.default_threshold) * 100
 
     def evaluate(self, order) -> bool:
         """
         Check if order total is greater than 100.
 
         Args:
-            order: Order instance with a 'total' attribute
+            order: Order instance with a 'total_cents' attribute
 
         Returns:
             True if total > 100, False otherwise
         """
-        threshold = self.config.get('threshold', Decimal('100.00'))
-        return order.total > threshold
+        return order.total_cents > self.threshold_cents
+
+    @classmethod
+    def vector_evaluate(cls, totals_cents, items):
+        """Check a batch of order totals (in cents) against the default threshold."""
+        return totals_cents > cls.default_threshold * 100
 
 
 class MinimumItemsRule(BaseRule):
@@ -40,6 +52,15 @@ class MinimumItemsRule(BaseRule):
     """
     name = "min_items_2"
     description = "Validates that order has at least 2 items"
+    default_threshold = 2
+    required_fields = ('items_count',)
+
+    __slots__ = ('threshold',)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Resolve the threshold once instead of on every evaluation
+        self.threshold = self.config.get('threshold', self.default_threshold)
 
     def evaluate(self, order) -> bool:
         """
@@ -51,8 +72,12 @@ class MinimumItemsRule(BaseRule):
         Returns:
             True if items_count >= 2, False otherwise
         """
-        threshold = self.config.get('threshold', 2)
-        return order.items_count >= threshold
+        return order.items_count >= self.threshold
+
+    @classmethod
+    def vector_evaluate(cls, totals_cents, items):
+        """Check a batch of item counts against the default threshold."""
+        return items >= cls.default_threshold
 
 
 class DivisibleByFiveRule(BaseRule):
@@ -61,16 +86,24 @@ class DivisibleByFiveRule(BaseRule):
     """
     name = "divisible_by_5"
     description = "Validates that order total is divisible by 5"
+    cost = 5
+    required_fields = ('total_cents',)
+
+    __slots__ = ()
 
     def evaluate(self, order) -> bool:
         """
         Check if order total is divisible by 5.
 
         Args:
-            order: Order instance with a 'total' attribute
+            order: Order instance with a 'total_cents' attribute
 
         Returns:
             True if total is divisible by 5, False otherwise
         """
-        # Convert to Decimal for precise division check
-        return order.total % Decimal('5.00') == Decimal('0.00')
+        return order.total_cents % 500 == 0
+
+    @classmethod
+    def vector_evaluate(cls, totals_cents, items):
+        """Check whether a batch of order totals (in cents) is divisible by 5."""
+        return totals_cents % 500 == 0
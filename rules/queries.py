@@ -0,0 +1,124 @@
+"""
+Order queries for rule evaluation.
+
+Fetches orders in the shape the requested rules need, so the rule engine
+itself stays free of model and query code.
+"""
+
+from types import SimpleNamespace
+from typing import Any
+
+from django.db.models.constants import LOOKUP_SEP
+
+from orders.models import Order
+from .engine import RuleRegistry
+
+
+def _is_forward_single(field) -> bool:
+    """Check whether a field is a forward foreign key or one-to-one relation."""
+    return field.concrete and (field.many_to_one or field.one_to_one)
+
+
+def _restrict_queryset(queryset: Any, fields: set, relations: set) -> Any:
+    """
+    Restrict a queryset to the given fields and load the given relations with it.
+
+    Relations made only of forward foreign keys (or one-to-ones) are joined
+    with select_related(); reverse and many-to-many relations are prefetched.
+    The first hop of a forward relation is always kept in the loaded fields,
+    since deferring its column would cost a query per row.
+
+    Args:
+        queryset: Queryset to restrict
+        fields: Set of field names to load, or None to load every field
+        relations: Set of relation paths (using '__' between hops)
+
+    Returns:
+        The restricted queryset
+    """
+    joined, prefetched = [], []
+    fields = set(fields) if fields is not None else None
+    for relation in sorted(relations):
+        model = queryset.model
+        forward = True
+        for hop, name in enumerate(relation.split(LOOKUP_SEP)):
+            field = model._meta.get_field(name)
+            if not _is_forward_single(field):
+                forward = False
+                break
+            if hop == 0 and fields is not None:
+                fields.add(name)
+            model = field.related_model
+        (joined if forward else prefetched).append(relation)
+
+    if fields is not None:
+        queryset = queryset.only(*fields)
+    if joined:
+        queryset = queryset.select_related(*joined)
+    if prefetched:
+        queryset = queryset.prefetch_related(*prefetched)
+    return queryset
+
+
+def order_queryset(rule_names: list) -> Any:
+    """
+    Build an Order queryset that loads only what the given rules read.
+
+    Args:
+        rule_names: List of (already validated) rule names
+
+    Returns:
+        Queryset restricted to the rules' required fields, with their
+        required relations joined or prefetched
+    """
+    return _restrict_queryset(
+        Order.objects.all(),
+        RuleRegistry.get_required_fields(rule_names),
+        RuleRegistry.get_required_relations(rule_names)
+    )
+
+
+def fetch_orders(order_ids: list, rule_names: list) -> dict:
+    """
+    Fetch orders in a form suitable for evaluating the given rules.
+
+    When every rule declares its fields and none needs related data,
+    the rows are loaded with values() and wrapped in lightweight
+    namespaces instead of full model instances.
+
+    Args:
+        order_ids: List of order ids to fetch
+        rule_names: List of (already validated) rule names
+
+    Returns:
+        Dictionary mapping the ids of the orders that exist to orders,
+        in the order the ids were given
+    """
+    fields = RuleRegistry.get_required_fields(rule_names)
+    if fields is None or RuleRegistry.get_required_relations(rule_names):
+        orders = order_queryset(rule_names).in_bulk(order_ids)
+    else:
+        rows = Order.objects.filter(id__in=order_ids).values(*fields)
+        orders = {row['id']: SimpleNamespace(**row) for row in rows}
+
+    return {
+        order_id: orders[order_id]
+        for order_id in dict.fromkeys(order_ids)
+        if order_id in orders
+    }
+
+
+def fetch_order(order_id: int, rule_names: list) -> Any:
+    """
+    Fetch a single order in a form suitable for evaluating the given rules.
+
+    See fetch_orders.
+
+    Args:
+        order_id: ID of the order to fetch
+        rule_names: List of (already validated) rule names
+
+    Returns:
+        The order, or None if it does not exist
+    """
+    return fetch_orders([order_id], rule_names).get(order_id)
@@ -0,0 +1,39 @@
+"""
+Renderers for the rules API.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Produces the same JSON as DRF's JSONRenderer for API payloads, using
+    DRF's encoder as a fallback for types orjson does not handle natively
+    (lazy translation strings, Decimal, datetimes, etc.).
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into JSON bytes.
+
+        Args:
+            data: The data to render
+            accepted_media_type: The negotiated media type
+            renderer_context: Additional context from the view
+
+        Returns:
+            The JSON-encoded response body
+        """
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=self.encoder.default, option=self.options)
@@ -6,21 +6,90 @@ from rest_framework import serializers
 from .engine import RuleRegistry
 
 
-class RuleCheckRequestSerializer(serializers.Serializer):
+def _invalid_rules_message(rule_names):
     """
-    Serializer for rule check requests.
+    Build the error message for requested rules that are not registered.
 
-    Validates that the order_id and rules are provided correctly.
+    Args:
+        rule_names: List of requested rule names
+
+    Returns:
+        The error message, or None if every rule exists
     """
-    order_id = serializers.IntegerField(
-        min_value=1,
-        help_text="ID of the order to validate"
+    valid_names = RuleRegistry.valid_names()
+    invalid_rules = [rule_name for rule_name in rule_names if rule_name not in valid_names]
+    if not invalid_rules:
+        return None
+    return (
+        f"Invalid rule(s): {', '.join(invalid_rules)}. "
+        f"Available rules: {', '.join(RuleRegistry.names())}"
+    )
+
+
+def _are_valid_names(rule_names):
+    """
+    Check that every item is a registered rule name, exactly as the
+    serializer's CharField would return it.
+    """
+    valid_names = RuleRegistry.valid_names()
+    return all(
+        type(rule_name) is str and rule_name in valid_names and len(rule_name) <= 100
+        for rule_name in rule_names
     )
+
+
+def validate_rule_check_request(data):
+    """
+    Validate a rule check request body, skipping the serializer machinery
+    for well-formed requests.
+
+    A body whose fields already hold their validated types and values (an
+    integer order_id, a list of registered rule names, an optional boolean
+    short_circuit) is accepted as-is. Anything else is handed to
+    RuleCheckRequestSerializer, so the validated data and errors are always
+    the serializer's.
+
+    Args:
+        data: The parsed request body
+
+    Returns:
+        Tuple of (validated_data, errors); errors is None when the
+        request is valid
+    """
+    if isinstance(data, dict):
+        order_id = data.get('order_id')
+        rules = data.get('rules')
+        short_circuit = data.get('short_circuit', False)
+        if (
+            type(order_id) is int and order_id >= 1
+            and type(rules) is list and rules
+            and type(short_circuit) is bool
+            and _are_valid_names(rules)
+        ):
+            return {'order_id': order_id, 'rules': rules, 'short_circuit': short_circuit}, None
+
+    serializer = RuleCheckRequestSerializer(data=data)
+    if serializer.is_valid():
+        return dict(serializer.validated_data), None
+    return None, serializer.errors
+
+
+class RuleSelectionSerializer(serializers.Serializer):
+    """
+    Base serializer for the rule selection shared by rule check requests.
+
+    Validates that the rules are provided correctly and exist.
+    """
     rules = serializers.ListField(
         child=serializers.CharField(max_length=100),
         min_length=1,
         help_text="List of rule names to apply"
     )
+    short_circuit = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text="Stop at the first failing rule; details then only include the rules that ran"
+    )
 
     def validate_rules(self, value):
         """
@@ -35,21 +104,45 @@ class RuleCheckRequestSerializer(serializers.Serializer):
         Raises:
             serializers.ValidationError: If any rule is not found
         """
-        invalid_rules = []
-        for rule_name in value:
-            if not RuleRegistry.rule_exists(rule_name):
-                invalid_rules.append(rule_name)
-
-        if invalid_rules:
-            available_rules = list(RuleRegistry.get_all_rules().keys())
-            raise serializers.ValidationError(
-                f"Invalid rule(s): {', '.join(invalid_rules)}. "
-                f"Available rules: {', '.join(available_rules)}"
-            )
+        message = _invalid_rules_message(value)
+        if message:
+            raise serializers.ValidationError(message)
 
         return value
 
 
+class RuleCheckRequestSerializer(RuleSelectionSerializer):
+    """
+    Serializer for rule check requests.
+
+    Validates that the order_id and rules are provided correctly.
+    RuleCheckView validates requests with validate_rule_check_request,
+    which only falls back to this serializer for bodies that are not
+    already well-formed; it also documents the request body in the API
+    schema.
+    """
+    order_id = serializers.IntegerField(
+        min_value=1,
+        help_text="ID of the order to validate"
+    )
+
+
+class RuleCheckBatchRequestSerializer(RuleSelectionSerializer):
+    """
+    Serializer for batch rule check requests.
+
+    Validates that the order_ids and rules are provided correctly.
+    """
+    MAX_ORDERS = 500
+
+    order_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=MAX_ORDERS,
+        help_text=f"IDs of the orders to validate (at most {MAX_ORDERS})"
+    )
+
+
 class RuleCheckResponseSerializer(serializers.Serializer):
     """
     Serializer for rule check responses.
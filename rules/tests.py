@@ -2,6 +2,10 @@
 Comprehensive test suite for the rules engine.
 """
 
+from types import MappingProxyType
+from unittest import mock
+
+from django.contrib.auth.models import Group, Permission
 from django.test import TestCase
 from rest_framework.test import APITestCase
 from rest_framework import status
@@ -9,6 +13,12 @@ from decimal import Decimal
 
 from orders.models import Order
 from .engine import BaseRule, RuleRegistry, RuleEngine
+from .queries import _restrict_queryset, fetch_order, fetch_orders
+from .serializers import (
+    RuleCheckBatchRequestSerializer,
+    RuleCheckRequestSerializer,
+    validate_rule_check_request
+)
 
 
 class TestRuleRegistry(TestCase):
@@ -36,6 +46,76 @@ class TestRuleRegistry(TestCase):
         self.assertTrue(RuleRegistry.rule_exists('min_total_100'))
         self.assertFalse(RuleRegistry.rule_exists('nonexistent_rule'))
 
+    def test_names(self):
+        """Test listing the registered rule names."""
+        self.assertIn('min_total_100', RuleRegistry.names())
+        self.assertNotIn('nonexistent_rule', RuleRegistry.names())
+
+    def test_valid_names(self):
+        """Test the cached set of registered rule names."""
+        valid_names = RuleRegistry.valid_names()
+        self.assertIsInstance(valid_names, frozenset)
+        self.assertEqual(valid_names, set(RuleRegistry.names()))
+        self.assertIs(valid_names, RuleRegistry.valid_names())
+
+    def test_register_after_freeze_raises_error(self):
+        """Test that the registry is frozen once the app is ready."""
+        rule_class = RuleRegistry.get_rule('min_total_100')
+        with self.assertRaises(RuntimeError):
+            RuleRegistry.register('late_rule', rule_class)
+        self.assertFalse(RuleRegistry.rule_exists('late_rule'))
+
+    def test_rule_without_evaluate_raises_error(self):
+        """Test that a rule must implement evaluate to be registered."""
+        with self.assertRaises(TypeError):
+            class IncompleteRule(BaseRule):
+                name = "incomplete_rule"
+
+        self.assertFalse(RuleRegistry.rule_exists('incomplete_rule'))
+
+    def test_get_instance_is_cached(self):
+        """Test that the registry hands out a single shared instance per rule."""
+        instance = RuleRegistry.get_instance('min_total_100')
+        self.assertIsInstance(instance, RuleRegistry.get_rule('min_total_100'))
+        self.assertIs(instance, RuleRegistry.get_instance('min_total_100'))
+
+    def test_rules_list_json_is_cached(self):
+        """Test that the serialized rule list is built once and reused."""
+        self.assertIs(
+            RuleRegistry.get_rules_list_json(),
+            RuleRegistry.get_rules_list_json()
+        )
+
+    def test_get_required_fields(self):
+        """Test collecting the fields needed by a set of rules."""
+        self.assertEqual(
+            RuleRegistry.get_required_fields(['min_total_100', 'divisible_by_5']),
+            {'id', 'total_cents'}
+        )
+        self.assertEqual(
+            RuleRegistry.get_required_fields(['min_total_100', 'min_items_2']),
+            {'id', 'total_cents', 'items_count'}
+        )
+
+    def test_get_required_relations(self):
+        """Test collecting the relations needed by a set of rules."""
+        self.assertEqual(
+            RuleRegistry.get_required_relations(['min_total_100', 'min_items_2']),
+            set()
+        )
+
+    def test_rule_instances_have_no_dict(self):
+        """Test that rule instances use slots instead of a __dict__."""
+        for name in RuleRegistry.names():
+            self.assertFalse(hasattr(RuleRegistry.get_instance(name), '__dict__'))
+
+    def test_get_nonexistent_instance_raises_error(self):
+        """Test that getting an instance of a non-existent rule raises KeyError."""
+        with self.assertRaises(KeyError):
+            RuleRegistry.get_instance('nonexistent_rule')
+        with self.assertRaises(KeyError):
+            RuleRegistry.get_instance_unchecked('nonexistent_rule')
+
 
 class TestOrderRules(TestCase):
     """Tests for individual order rules."""
@@ -73,6 +153,16 @@ class TestOrderRules(TestCase):
         self.assertFalse(rule.evaluate(self.order_low_total))
         self.assertTrue(rule.evaluate(self.order_divisible))
 
+    def test_rule_threshold_config(self):
+        """Test that a configured threshold overrides the default."""
+        rule = RuleRegistry.get_rule('min_total_100')(threshold=160)
+        self.assertFalse(rule.evaluate(self.order_high_total))
+        self.assertTrue(rule.evaluate(self.order_divisible))
+
+        rule = RuleRegistry.get_rule('min_items_2')(threshold=4)
+        self.assertFalse(rule.evaluate(self.order_high_total))
+        self.assertTrue(rule.evaluate(self.order_divisible))
+
     def test_divisible_by_5_rule(self):
         """Test the divisible_by_5 rule."""
         rule_class = RuleRegistry.get_rule('divisible_by_5')
@@ -125,11 +215,208 @@ class TestRuleEngine(TestCase):
         self.assertEqual(result['details']['min_total_100'], True)
         self.assertEqual(result['details']['divisible_by_5'], False)
 
+    def test_evaluate_short_circuit_stops_at_first_failure(self):
+        """Test that short-circuit evaluation skips rules after a failure."""
+        order = Order.objects.create(total=Decimal('73.00'), items_count=1)
+        result = self.engine.evaluate_rules(
+            order,
+            ['min_total_100', 'min_items_2'],
+            short_circuit=True
+        )
+
+        self.assertFalse(result['passed'])
+        self.assertEqual(result['details'], {'min_total_100': False})
+
+    def test_evaluate_short_circuit_runs_cheap_rules_first(self):
+        """Test that short-circuit evaluation orders rules by cost."""
+        order = Order.objects.create(total=Decimal('73.00'), items_count=1)
+        result = self.engine.evaluate_rules(
+            order,
+            ['divisible_by_5', 'min_items_2'],
+            short_circuit=True
+        )
+
+        self.assertFalse(result['passed'])
+        self.assertEqual(result['details'], {'min_items_2': False})
+
+    def test_evaluate_reflects_order_changes(self):
+        """Test that results reflect changes to the order."""
+        result = self.engine.evaluate_rules(self.order, ['divisible_by_5'])
+        self.assertFalse(result['passed'])
+
+        self.order.total = Decimal('155.00')
+        self.order.save()
+
+        result = self.engine.evaluate_rules(self.order, ['divisible_by_5'])
+        self.assertTrue(result['passed'])
+
     def test_evaluate_nonexistent_rule_raises_error(self):
         """Test that evaluating a non-existent rule raises an error."""
         with self.assertRaises(KeyError):
             self.engine.evaluate_rules(self.order, ['nonexistent_rule'])
 
+    def test_evaluate_rules_bulk_matches_single_evaluation(self):
+        """Test that bulk evaluation agrees with per-order evaluation."""
+        Order.objects.create(total=Decimal('200.00'), items_count=5)
+        Order.objects.create(total=Decimal('75.50'), items_count=1)
+        rule_names = ['min_total_100', 'min_items_2', 'divisible_by_5']
+
+        results = self.engine.evaluate_rules_bulk(Order.objects.all(), rule_names)
+
+        self.assertEqual(len(results), 3)
+        for order in Order.objects.all():
+            self.assertEqual(
+                results[order.id],
+                self.engine.evaluate_rules(order, rule_names)
+            )
+
+    def test_evaluate_rules_bulk_without_vector_impl(self):
+        """Test that rules without vector_evaluate fall back to per-order evaluation."""
+        Order.objects.create(total=Decimal('200.00'), items_count=5)
+        rule_names = ['min_total_100', 'divisible_by_5']
+
+        with mock.patch.object(RuleRegistry, '_vector_impls', MappingProxyType({})):
+            results = self.engine.evaluate_rules_bulk(Order.objects.all()[:2], rule_names)
+
+        self.assertEqual(len(results), 2)
+        for order in Order.objects.all():
+            self.assertEqual(
+                results[order.id],
+                self.engine.evaluate_rules(order, rule_names)
+            )
+
+    def test_evaluate_rules_many(self):
+        """Test evaluating rules against a mapping of orders."""
+        order = Order.objects.create(total=Decimal('75.50'), items_count=1)
+        orders = {self.order.id: self.order, order.id: order}
+
+        results = self.engine.evaluate_rules_many(orders, ['min_total_100', 'min_items_2'])
+
+        self.assertEqual(list(results), [self.order.id, order.id])
+        self.assertTrue(results[self.order.id]['passed'])
+        self.assertFalse(results[order.id]['passed'])
+
+    def test_evaluate_rules_bulk_nonexistent_rule_raises_error(self):
+        """Test that bulk evaluation of a non-existent rule raises an error."""
+        with self.assertRaises(KeyError):
+            self.engine.evaluate_rules_bulk(Order.objects.all(), ['nonexistent_rule'])
+
+
+class TestOrderQueries(TestCase):
+    """Tests for fetching orders for rule evaluation."""
+
+    def setUp(self):
+        """Create test orders."""
+        self.order = Order.objects.create(
+            total=Decimal('152.00'),
+            items_count=3
+        )
+
+    def test_fetch_orders(self):
+        """Test fetching several orders in one query, in the requested order."""
+        order = Order.objects.create(total=Decimal('75.50'), items_count=1)
+
+        with self.assertNumQueries(1):
+            orders = fetch_orders(
+                [self.order.id, order.id, 99999],
+                ['min_total_100', 'min_items_2']
+            )
+
+        self.assertEqual(list(orders), [self.order.id, order.id])
+        self.assertEqual(orders[order.id].total_cents, 7550)
+
+    def test_fetch_order_loads_only_declared_fields(self):
+        """Test that orders are fetched as plain rows of the declared fields."""
+        order = fetch_order(self.order.id, ['min_total_100'])
+
+        self.assertNotIsInstance(order, Order)
+        self.assertEqual(vars(order), {'id': self.order.id, 'total_cents': 15200})
+        self.assertTrue(RuleEngine.evaluate_rules(order, ['min_total_100'])['passed'])
+        self.assertIsNone(fetch_order(99999, ['min_total_100']))
+
+
+class TestRestrictQueryset(TestCase):
+    """Tests for loading declared relations together with restricted fields."""
+
+    def test_forward_relation_is_joined(self):
+        """Test that a forward foreign key is joined and its column kept."""
+        queryset = _restrict_queryset(
+            Permission.objects.all(), {'id', 'codename'}, {'content_type'}
+        )
+
+        with self.assertNumQueries(1):
+            app_labels = [permission.content_type.app_label for permission in queryset]
+
+        self.assertIn('orders', app_labels)
+
+    def test_many_to_many_relation_is_prefetched(self):
+        """Test that a many-to-many relation is prefetched in a single extra query."""
+        for name in ('first', 'second'):
+            group = Group.objects.create(name=name)
+            group.permissions.set(Permission.objects.all()[:2])
+        queryset = _restrict_queryset(Group.objects.all(), {'id'}, {'permissions'})
+
+        with self.assertNumQueries(2):
+            counts = [len(group.permissions.all()) for group in queryset]
+
+        self.assertEqual(counts, [2, 2])
+
+    def test_all_fields_are_loaded_without_declared_fields(self):
+        """Test that relations are loaded without restricting the fields."""
+        queryset = _restrict_queryset(Permission.objects.all(), None, {'content_type'})
+
+        with self.assertNumQueries(1):
+            names = [(p.name, p.content_type.model) for p in queryset]
+
+        self.assertTrue(names)
+
+
+class TestRuleCheckRequestValidation(TestCase):
+    """Tests for the hand-rolled rule check request validation."""
+
+    def test_matches_serializer(self):
+        """Test that validation agrees with RuleCheckRequestSerializer."""
+        payloads = [
+            {'order_id': 1, 'rules': ['min_total_100', 'min_items_2']},
+            {},
+            {'order_id': 'abc', 'rules': ['min_total_100']},
+            {'order_id': -1, 'rules': ['min_total_100']},
+            {'order_id': 1, 'rules': []},
+            {'order_id': 1, 'rules': 'min_total_100'},
+            {'order_id': 1, 'rules': ['x' * 101]},
+            {'order_id': 1, 'rules': ['min_total_100', 'invalid_rule']},
+            {'order_id': 1, 'rules': ['min_total_100'], 'short_circuit': True},
+            {'order_id': 1, 'rules': ['min_total_100'], 'short_circuit': 'maybe'},
+            {'order_id': 1, 'rules': ['min_total_100'], 'short_circuit': 'true'},
+            {'order_id': 1, 'rules': ['min_total_100'], 'short_circuit': None},
+            {'order_id': 1, 'rules': [' min_total_100']},
+            {'order_id': 1, 'rules': ['']},
+            {'order_id': 1, 'rules': [None]},
+            {'order_id': 1, 'rules': None},
+            {'order_id': None, 'rules': ['min_total_100']},
+            {'order_id': '1', 'rules': ['min_total_100']},
+            {'order_id': True, 'rules': ['min_total_100']},
+        ]
+
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                serializer = RuleCheckRequestSerializer(data=payload)
+                validated_data, errors = validate_rule_check_request(payload)
+
+                if serializer.is_valid():
+                    self.assertIsNone(errors)
+                    self.assertEqual(validated_data, dict(serializer.validated_data))
+                else:
+                    self.assertIsNone(validated_data)
+                    self.assertEqual(errors, serializer.errors)
+
+    def test_rejects_non_dict_body(self):
+        """Test that a non-object request body is rejected."""
+        validated_data, errors = validate_rule_check_request(['min_total_100'])
+
+        self.assertIsNone(validated_data)
+        self.assertIn('non_field_errors', errors)
+
 
 class TestRuleCheckAPI(APITestCase):
     """Tests for the Rule Check API endpoint."""
@@ -153,7 +440,8 @@ class TestRuleCheckAPI(APITestCase):
             'rules': ['min_total_100', 'min_items_2']
         }
 
-        response = self.client.post(url, data, format='json')
+        with self.assertNumQueries(1):
+            response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(response.data['passed'])
@@ -175,6 +463,41 @@ class TestRuleCheckAPI(APITestCase):
         self.assertEqual(response.data['details']['min_total_100'], False)
         self.assertEqual(response.data['details']['min_items_2'], False)
 
+    def test_rule_check_reflects_order_changes(self):
+        """Test that every check is evaluated with a single query against the current order."""
+        url = '/rules/check/'
+        data = {
+            'order_id': self.order_low_total.id,
+            'rules': ['min_total_100', 'min_items_2']
+        }
+
+        with self.assertNumQueries(1):
+            response = self.client.post(url, data, format='json')
+        self.assertFalse(response.data['passed'])
+
+        self.order_low_total.total = Decimal('120.00')
+        self.order_low_total.items_count = 2
+        self.order_low_total.save()
+
+        with self.assertNumQueries(1):
+            response = self.client.post(url, data, format='json')
+        self.assertTrue(response.data['passed'])
+
+    def test_rule_check_short_circuit(self):
+        """Test rule check that stops at the first failing rule."""
+        url = '/rules/check/'
+        data = {
+            'order_id': self.order_low_total.id,
+            'rules': ['divisible_by_5', 'min_items_2'],
+            'short_circuit': True
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data['passed'])
+        self.assertEqual(response.data['details'], {'min_items_2': False})
+
     def test_rule_check_order_not_found(self):
         """Test rule check with non-existent order."""
         url = '/rules/check/'
@@ -186,7 +509,7 @@ class TestRuleCheckAPI(APITestCase):
         response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertIn('error', response.data)
+        self.assertIn('error', response.json())
 
     def test_rule_check_invalid_rule(self):
         """Test rule check with invalid rule name."""
@@ -201,6 +524,20 @@ class TestRuleCheckAPI(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('error', response.data)
 
+    def test_rule_check_renders_nested_errors(self):
+        """Test that per-item errors with integer keys render as JSON."""
+        url = '/rules/check/'
+        data = {
+            'order_id': self.order_high_total.id,
+            'rules': ['x' * 101]
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('0', response.json()['detail']['rules'])
+
     def test_rule_check_missing_fields(self):
         """Test rule check with missing required fields."""
         url = '/rules/check/'
@@ -223,6 +560,70 @@ class TestRuleCheckAPI(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
+class TestRuleCheckBatchAPI(APITestCase):
+    """Tests for the batch Rule Check API endpoint."""
+
+    def setUp(self):
+        """Create test orders."""
+        self.order_high_total = Order.objects.create(
+            total=Decimal('150.00'),
+            items_count=3
+        )
+        self.order_low_total = Order.objects.create(
+            total=Decimal('75.50'),
+            items_count=1
+        )
+
+    def test_batch_check_success(self):
+        """Test checking several orders in one request and one query."""
+        url = '/rules/check/batch/'
+        data = {
+            'order_ids': [self.order_high_total.id, self.order_low_total.id, 99999],
+            'rules': ['min_total_100', 'min_items_2']
+        }
+
+        with self.assertNumQueries(1):
+            response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()
+        self.assertEqual(
+            list(results),
+            [str(self.order_high_total.id), str(self.order_low_total.id)]
+        )
+        self.assertTrue(results[str(self.order_high_total.id)]['passed'])
+        self.assertFalse(results[str(self.order_low_total.id)]['passed'])
+        self.assertEqual(
+            results[str(self.order_low_total.id)]['details'],
+            {'min_total_100': False, 'min_items_2': False}
+        )
+
+    def test_batch_check_invalid_rule(self):
+        """Test batch check with invalid rule name."""
+        url = '/rules/check/batch/'
+        data = {
+            'order_ids': [self.order_high_total.id],
+            'rules': ['invalid_rule']
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('error', response.data)
+
+    def test_batch_check_too_many_orders(self):
+        """Test batch check with more order ids than allowed."""
+        url = '/rules/check/batch/'
+        data = {
+            'order_ids': list(range(1, RuleCheckBatchRequestSerializer.MAX_ORDERS + 2)),
+            'rules': ['min_total_100']
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 class TestRuleListAPI(APITestCase):
     """Tests for the Rule List API endpoint."""
 
@@ -230,17 +631,39 @@ class TestRuleListAPI(APITestCase):
         """Test listing all available rules."""
         url = '/rules/'
         response = self.client.get(url)
+        data = response.json()
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIsInstance(response.data, list)
-        self.assertGreaterEqual(len(response.data), 3)
+        self.assertIsInstance(data, list)
+        self.assertGreaterEqual(len(data), 3)
 
-        rule_names = [rule['name'] for rule in response.data]
+        rule_names = [rule['name'] for rule in data]
         self.assertIn('min_total_100', rule_names)
         self.assertIn('min_items_2', rule_names)
         self.assertIn('divisible_by_5', rule_names)
 
         # Check that each rule has required fields
-        for rule in response.data:
+        for rule in data:
             self.assertIn('name', rule)
             self.assertIn('description', rule)
+
+    def test_list_rules_not_modified(self):
+        """Test that the rule list honors If-None-Match with its ETag."""
+        url = '/rules/'
+        response = self.client.get(url)
+        etag = response['ETag']
+
+        self.assertTrue(etag)
+        self.assertIn('max-age', response['Cache-Control'])
+
+        for if_none_match in (etag, f'W/{etag}', f'"stale", {etag}', '*'):
+            with self.subTest(if_none_match=if_none_match):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=if_none_match)
+
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                self.assertEqual(response['ETag'], etag)
+                self.assertIn('max-age', response['Cache-Control'])
+                self.assertEqual(response.content, b'')
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='"stale"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -3,11 +3,12 @@ URL configuration for rules app.
 """
 
 from django.urls import path
-from .views import RuleCheckView, RuleListView
+from .views import RuleCheckBatchView, RuleCheckView, RuleListView
 
 app_name = 'rules'
 
 urlpatterns = [
     path('check/', RuleCheckView.as_view(), name='rule-check'),
+    path('check/batch/', RuleCheckBatchView.as_view(), name='rule-check-batch'),
     path('', RuleListView.as_view(), name='rule-list'),
 ]
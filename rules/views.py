@@ -2,23 +2,56 @@
 API views for rule evaluation.
 """
 
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 import logging
 
-from orders.models import Order
-from .engine import RuleEngine, RuleRegistry
+from .engine import DEFAULT_ENGINE, RuleRegistry
+from .queries import fetch_order, fetch_orders
 from .serializers import (
+    RuleCheckBatchRequestSerializer,
     RuleCheckRequestSerializer,
     RuleCheckResponseSerializer,
-    RuleInfoSerializer
+    RuleInfoSerializer,
+    validate_rule_check_request
 )
 
 logger = logging.getLogger(__name__)
 
+if settings.ENABLE_SWAGGER:
+    from drf_yasg.utils import swagger_auto_schema
+else:
+    def swagger_auto_schema(**kwargs):
+        """No-op stand-in for drf_yasg's decorator when the API docs are disabled."""
+        return lambda view_method: view_method
+
+
+ORDER_NOT_FOUND_ERROR = 'Order not found'
+
+
+def _order_not_found(order_id):
+    """
+    Build the 404 response for a missing order.
+
+    The body is always JSON, so it is returned as a JsonResponse without
+    going through DRF content negotiation and rendering.
+    """
+    logger.warning("Order %s not found", order_id)
+    return JsonResponse(
+        {
+            'error': ORDER_NOT_FOUND_ERROR,
+            'detail': f'Order with id {order_id} does not exist'
+        },
+        status=status.HTTP_404_NOT_FOUND
+    )
+
 
 class RuleCheckView(APIView):
     """
@@ -56,7 +89,8 @@ class RuleCheckView(APIView):
         Request body:
         {
             "order_id": 1,
-            "rules": ["min_total_100", "min_items_2"]
+            "rules": ["min_total_100", "min_items_2"],
+            "short_circuit": false
         }
 
         Response:
@@ -69,49 +103,113 @@ class RuleCheckView(APIView):
         }
         """
         # Validate request data
-        serializer = RuleCheckRequestSerializer(data=request.data)
-        if not serializer.is_valid():
-            logger.warning(f"Invalid request data: {serializer.errors}")
+        validated_data, errors = validate_rule_check_request(request.data)
+        if errors:
+            logger.warning("Invalid request data: %s", errors)
             return Response(
                 {
                     'error': 'Invalid request',
-                    'detail': serializer.errors
+                    'detail': errors
                 },
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        validated_data = serializer.validated_data
         order_id = validated_data['order_id']
         rule_names = validated_data['rules']
 
-        # Retrieve the order
-        try:
-            order = Order.objects.get(id=order_id)
-        except Order.DoesNotExist:
-            logger.warning(f"Order {order_id} not found")
+        short_circuit = validated_data['short_circuit']
+
+        # Retrieve the order, loading only the fields and relations the rules read
+        order = fetch_order(order_id, rule_names)
+        if order is None:
+            return _order_not_found(order_id)
+
+        # Evaluate rules; unexpected errors are logged by the API exception handler
+        result = DEFAULT_ENGINE.evaluate_rules(order, rule_names, short_circuit=short_circuit)
+
+        logger.info(
+            "Rules evaluated for order %s: Passed=%s, Details=%s",
+            order_id, result['passed'], result['details']
+        )
+
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class RuleCheckBatchView(APIView):
+    """
+    API endpoint to evaluate rules against several orders at once.
+
+    POST /rules/check/batch/
+    """
+
+    @swagger_auto_schema(
+        operation_description="Evaluate multiple rules against several orders",
+        request_body=RuleCheckBatchRequestSerializer,
+        responses={
+            200: openapi.Response('Results by order id', openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                additional_properties=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'passed': openapi.Schema(type=openapi.TYPE_BOOLEAN),
+                        'details': openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            additional_properties=openapi.Schema(type=openapi.TYPE_BOOLEAN)
+                        ),
+                    }
+                )
+            )),
+            400: openapi.Response('Bad Request', openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    'error': openapi.Schema(type=openapi.TYPE_STRING),
+                    'detail': openapi.Schema(type=openapi.TYPE_STRING),
+                }
+            )),
+        },
+        tags=['Rules']
+    )
+    def post(self, request):
+        """
+        Evaluate rules against several orders, fetched with a single query.
+
+        Results follow the order of order_ids; orders that do not exist are
+        left out of the response.
+
+        Request body:
+        {
+            "order_ids": [1, 2],
+            "rules": ["min_total_100", "min_items_2"]
+        }
+
+        Response:
+        {
+            "1": {"passed": true, "details": {"min_total_100": true, "min_items_2": true}},
+            "2": {"passed": false, "details": {"min_total_100": false, "min_items_2": false}}
+        }
+        """
+        serializer = RuleCheckBatchRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            logger.warning("Invalid request data: %s", serializer.errors)
             return Response(
                 {
-                    'error': 'Order not found',
-                    'detail': f'Order with id {order_id} does not exist'
+                    'error': 'Invalid request',
+                    'detail': serializer.errors
                 },
-                status=status.HTTP_404_NOT_FOUND
-            )
-
-        # Evaluate rules
-        try:
-            engine = RuleEngine()
-            result = engine.evaluate_rules(order, rule_names)
-
-            logger.info(
-                f"Rules evaluated for order {order_id}: "
-                f"Passed={result['passed']}, Details={result['details']}"
+                status=status.HTTP_400_BAD_REQUEST
             )
 
-            return Response(result, status=status.HTTP_200_OK)
+        validated_data = serializer.validated_data
+        order_ids = validated_data['order_ids']
+        rule_names = validated_data['rules']
+        results = DEFAULT_ENGINE.evaluate_rules_many(
+            fetch_orders(order_ids, rule_names),
+            rule_names,
+            short_circuit=validated_data['short_circuit']
+        )
 
-        except Exception as e:
-            logger.error(f"Error evaluating rules: {str(e)}", exc_info=True)
-            raise
+        logger.info("Rules evaluated for %s of %s orders", len(results), len(order_ids))
+        return Response(results, status=status.HTTP_200_OK)
 
 
 class RuleListView(APIView):
@@ -128,6 +226,12 @@ class RuleListView(APIView):
         },
         tags=['Rules']
     )
+    # The rule list only changes on deploy, so clients may reuse it for a while
+    # and revalidate it against the registry's ETag
+    @method_decorator([
+        cache_control(public=True, max_age=300),
+        condition(etag_func=lambda request: RuleRegistry.get_rules_list_etag()),
+    ])
     def get(self, request):
         """
         Get all available rules.
@@ -141,14 +245,9 @@ class RuleListView(APIView):
             ...
         ]
         """
-        rules = RuleRegistry.get_all_rules()
-        rules_info = [
-            {
-                'name': rule_class.name,
-                'description': rule_class.description
-            }
-            for rule_class in rules.values()
-        ]
-
-        logger.info(f"Retrieved {len(rules_info)} available rules")
-        return Response(rules_info, status=status.HTTP_200_OK)
+        logger.info("Retrieved %s available rules", len(RuleRegistry.names()))
+        return HttpResponse(
+            RuleRegistry.get_rules_list_json(),
+            content_type='application/json',
+            status=status.HTTP_200_OK
+        )